@@ -1,16 +1,34 @@
 import argparse
+import functools
+import multiprocessing
+import os
 import platform
-from typing import List, Tuple
+import queue
+import warnings
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List, Optional, Tuple, Union
 
 import cv2
-from PIL import Image, ImageDraw, ImageFont
+import numpy as np
+from PIL import ExifTags, Image, ImageDraw, ImageFont, UnidentifiedImageError
 
 # Define ASCII characters based on intensity
 ASCII_CHARS = "@%#*+=-:. "
 
+# Size of the pixel block represented by one ASCII character
+CHAR_WIDTH = 6
+CHAR_HEIGHT = 12
+
+# OpenCV flags decoding a grayscale image directly at 1/k resolution
+REDUCED_GRAYSCALE_FLAGS = {
+    2: cv2.IMREAD_REDUCED_GRAYSCALE_2,
+    4: cv2.IMREAD_REDUCED_GRAYSCALE_4,
+    8: cv2.IMREAD_REDUCED_GRAYSCALE_8,
+}
+
 
 def resize_image_for_ascii(
-    image: cv2.Mat, char_width: int = 6, char_height: int = 12
+    image: cv2.Mat, char_width: int = CHAR_WIDTH, char_height: int = CHAR_HEIGHT
 ) -> Tuple[cv2.Mat, int, int]:
     """
     Resize the image for ASCII conversion by downsizing based on character dimensions.
@@ -26,11 +44,35 @@ def resize_image_for_ascii(
     original_height, original_width = image.shape
     new_width = original_width // char_width
     new_height = original_height // char_height
-    resized_image = cv2.resize(image, (new_width, new_height))
+    # Cropping to a whole number of character blocks makes the scale factors
+    # exact integers, so area averaging takes OpenCV's block-mean fast path and
+    # each ASCII cell gets the mean intensity of exactly one pixel block.
+    cropped_image = image[: new_height * char_height, : new_width * char_width]
+    resized_image = cv2.resize(
+        cropped_image, (new_width, new_height), interpolation=cv2.INTER_AREA
+    )
     return resized_image, new_width, new_height
 
 
-def image_to_ascii(image: cv2.Mat, ascii_chars: str = ASCII_CHARS) -> List[str]:
+@functools.lru_cache(maxsize=8)
+def build_intensity_lut(ascii_chars: str = ASCII_CHARS) -> np.ndarray:
+    """
+    Build a 256-entry lookup table mapping grayscale intensity to an ASCII code.
+
+    Args:
+        ascii_chars (str): Characters to represent intensity levels.
+
+    Returns:
+        np.ndarray: Read-only uint8 array where entry ``p`` is the character code for intensity ``p``.
+    """
+    codes = np.frombuffer(ascii_chars.encode("ascii"), dtype=np.uint8)
+    scale = 256 // len(codes)
+    lut = codes[np.minimum(np.arange(256) // scale, len(codes) - 1)]
+    lut.setflags(write=False)
+    return lut
+
+
+def image_to_ascii(image: cv2.Mat, ascii_chars: str = ASCII_CHARS) -> np.ndarray:
     """
     Convert a grayscale image to ASCII characters.
 
@@ -38,16 +80,44 @@ def image_to_ascii(image: cv2.Mat, ascii_chars: str = ASCII_CHARS) -> List[str]:
         image (cv2.Mat): Grayscale image.
         ascii_chars (str): Characters to represent intensity levels.
 
+    Returns:
+        np.ndarray: ASCII art as a 2D uint8 array of character codes, one row per line.
+    """
+    return cv2.LUT(image, build_intensity_lut(ascii_chars))
+
+
+def as_strings(ascii_codes: np.ndarray) -> List[str]:
+    """
+    Decode a 2D array of ASCII codes into one string per row, e.g. for printing.
+
+    Args:
+        ascii_codes (np.ndarray): ASCII art as a 2D uint8 array of character codes.
+
     Returns:
         List[str]: ASCII art as a list of strings.
     """
-    scale = 256 // len(ascii_chars)
-    return [
-        "".join(ascii_chars[min(len(ascii_chars) - 1, pixel // scale)] for pixel in row)
-        for row in image
-    ]
+    return [row.tobytes().decode("ascii") for row in ascii_codes]
+
+
+def _ascii_codes(ascii_art: Union[List[str], np.ndarray]) -> np.ndarray:
+    """
+    Encode ASCII art as a 2D array of character codes, passing arrays through.
+
+    Args:
+        ascii_art (Union[List[str], np.ndarray]): ASCII art as strings or as a uint8 array.
+
+    Returns:
+        np.ndarray: ASCII art as a 2D uint8 array of character codes.
+    """
+    if isinstance(ascii_art, np.ndarray):
+        return ascii_art
+    if len({len(line) for line in ascii_art}) > 1:
+        raise ValueError("All rows of ASCII art must have the same length.")
+    codes = np.frombuffer("".join(ascii_art).encode("ascii"), dtype=np.uint8)
+    return codes.reshape(len(ascii_art), -1)
 
 
+@functools.lru_cache(maxsize=1)
 def get_default_font() -> str:
     """
     Return a default monospaced font path based on the operating system.
@@ -66,66 +136,354 @@ def get_default_font() -> str:
         raise RuntimeError("Unsupported OS. Please specify a font manually.")
 
 
+@functools.lru_cache(maxsize=32)
+def load_font(font_path: str, font_size: int) -> ImageFont.FreeTypeFont:
+    """
+    Load a TrueType font, reusing the parsed face for repeated path/size pairs.
+
+    Args:
+        font_path (str): Path to the font file.
+        font_size (int): Font size in pixels.
+
+    Returns:
+        ImageFont.FreeTypeFont: Loaded font.
+    """
+    return ImageFont.truetype(font_path, font_size)
+
+
+@functools.lru_cache(maxsize=256)
+def render_glyph(
+    char: str, font: ImageFont.FreeTypeFont
+) -> Optional[Tuple[np.ndarray, Tuple[int, int]]]:
+    """
+    Rasterize a single character once so it can be blitted into a canvas.
+
+    Results are cached per (character, font), so rendering further images at
+    the same font size reuses the bitmaps instead of calling FreeType again.
+
+    Args:
+        char (str): Character to rasterize.
+        font (ImageFont.FreeTypeFont): Font used to render the character.
+
+    Returns:
+        Optional[Tuple[np.ndarray, Tuple[int, int]]]: Read-only grayscale tile (0 = ink, 255 = paper) and its
+        (x, y) offset from the text origin, or None if the character leaves no ink (e.g. a space).
+    """
+    left, top, right, bottom = font.getbbox(char)
+    if right <= left or bottom <= top:
+        return None
+    mask = Image.new("L", (right - left, bottom - top), 0)
+    ImageDraw.Draw(mask).text((-left, -top), char, fill=255, font=font)
+    if mask.getbbox() is None:
+        return None
+    tile = 255 - np.asarray(mask)
+    tile.setflags(write=False)
+    return tile, (left, top)
+
+
+@functools.lru_cache(maxsize=32)
+def build_cell_tiles(
+    chars: str,
+    font: ImageFont.FreeTypeFont,
+    tile_width: int,
+    tile_height: int,
+) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Pre-render one tile for each of the given characters, aligned to the cell grid.
+
+    Glyphs may extend beyond their cell, so every tile spans a block of whole
+    cells large enough to hold the biggest glyph, with the character's own
+    cell at the same position in each tile.
+
+    Results are cached, so consecutive frames with the same size and character
+    set reuse the tiles without any font work.
+
+    Args:
+        chars (str): Characters to render.
+        font (ImageFont.FreeTypeFont): Font used to render the characters.
+        tile_width (int): Width of a cell in pixels.
+        tile_height (int): Height of a cell in pixels.
+
+    Returns:
+        Tuple[np.ndarray, Tuple[int, int]]: Read-only array of shape (256, rows * tile_height,
+        cols * tile_width) indexed by character code, where tiles of other or inkless
+        characters are blank paper (255); and the (row, column) of the character's own
+        cell within the tile.
+    """
+    # Spaces (the most common character in bright areas) and any other
+    # inkless glyph stay blank without asking FreeType.
+    glyphs = {
+        char: glyph
+        for char in chars
+        if not char.isspace() and (glyph := render_glyph(char, font)) is not None
+    }
+    # Bounding box of all glyphs relative to the cell origin, widened to at
+    # least the cell itself, then rounded outwards to whole cells.
+    top = min([0] + [dy for _, (_, dy) in glyphs.values()])
+    left = min([0] + [dx for _, (dx, _) in glyphs.values()])
+    bottom = max([tile_height] + [dy + t.shape[0] for t, (_, dy) in glyphs.values()])
+    right = max([tile_width] + [dx + t.shape[1] for t, (dx, _) in glyphs.values()])
+    cells_above = -(top // tile_height)
+    cells_left = -(left // tile_width)
+    cells_below = -(-bottom // tile_height)
+    cells_right = -(-right // tile_width)
+
+    tiles = np.full(
+        (
+            256,
+            (cells_above + cells_below) * tile_height,
+            (cells_left + cells_right) * tile_width,
+        ),
+        255,
+        dtype=np.uint8,
+    )
+    origin_y = cells_above * tile_height
+    origin_x = cells_left * tile_width
+    for char, (tile, (dx, dy)) in glyphs.items():
+        tiles[
+            ord(char),
+            origin_y + dy : origin_y + dy + tile.shape[0],
+            origin_x + dx : origin_x + dx + tile.shape[1],
+        ] = tile
+    tiles.setflags(write=False)
+    return tiles, (cells_above, cells_left)
+
+
+def render_ascii_art(
+    ascii_art: Union[List[str], np.ndarray], original_width: int, original_height: int
+) -> np.ndarray:
+    """
+    Render ASCII art as black text on a white grayscale canvas.
+
+    Args:
+        ascii_art (Union[List[str], np.ndarray]): ASCII art as a 2D uint8 array of character codes or a list of strings.
+        original_width (int): Width of the output image.
+        original_height (int): Height of the output image.
+
+    Returns:
+        np.ndarray: Grayscale canvas of shape (original_height, original_width).
+    """
+    ascii_codes = _ascii_codes(ascii_art)
+    rows, cols = ascii_codes.shape
+    char_width = original_width / cols
+    char_height = original_height / rows
+
+    font_path = get_default_font()
+    font_size = int(min(char_width, char_height) * 1.5)
+    font = load_font(font_path, font_size)
+
+    # Each character in use is rendered once into a tile aligned to whole-pixel
+    # cells, so the grid can be composed with gathers of tiles by character
+    # code instead of rasterizing or blitting cell by cell. When the cells are
+    # not a whole number of pixels, the grid is stretched to the requested
+    # size with a nearest-neighbour resize, which costs next to nothing.
+    tile_width = max(int(char_width), 1)
+    tile_height = max(int(char_height), 1)
+    used_codes = np.flatnonzero(np.bincount(ascii_codes.ravel(), minlength=256))
+    tiles, (cells_above, cells_left) = build_cell_tiles(
+        "".join(map(chr, used_codes)), font, tile_width, tile_height
+    )
+    block_rows = tiles.shape[1] // tile_height
+    block_cols = tiles.shape[2] // tile_width
+
+    # Tiles covering more than one cell overlap their neighbours: gather each
+    # cell-sized block of the tiles as a whole grid, shifted by its position in
+    # the tile, and keep the darkest value wherever the shifted grids overlap.
+    canvas = np.full(
+        ((rows + block_rows - 1) * tile_height, (cols + block_cols - 1) * tile_width),
+        255,
+        dtype=np.uint8,
+    )
+    for block_row in range(block_rows):
+        for block_col in range(block_cols):
+            block = tiles[
+                :,
+                block_row * tile_height : (block_row + 1) * tile_height,
+                block_col * tile_width : (block_col + 1) * tile_width,
+            ]
+            grid = (
+                block[ascii_codes]
+                .transpose(0, 2, 1, 3)
+                .reshape(rows * tile_height, cols * tile_width)
+            )
+            region = canvas[
+                block_row * tile_height : block_row * tile_height + grid.shape[0],
+                block_col * tile_width : block_col * tile_width + grid.shape[1],
+            ]
+            np.minimum(region, grid, out=region)
+    canvas = canvas[
+        cells_above * tile_height : (cells_above + rows) * tile_height,
+        cells_left * tile_width : (cells_left + cols) * tile_width,
+    ]
+
+    if canvas.shape != (original_height, original_width):
+        canvas = cv2.resize(
+            canvas,
+            (original_width, original_height),
+            interpolation=cv2.INTER_NEAREST,
+        )
+    return canvas
+
+
+def save_rendered_image(canvas: np.ndarray, output_path: str):
+    """
+    Save a rendered ASCII art canvas as an image file.
+
+    Args:
+        canvas (np.ndarray): Grayscale canvas returned by render_ascii_art.
+        output_path (str): Path to save the output image.
+    """
+    # The rendering is black ink on white paper, so a single grayscale channel
+    # holds it losslessly. PNG zlib level 1 encodes it several times faster
+    # than the default level 6 at a modest size cost; other formats ignore it.
+    Image.fromarray(canvas, "L").save(output_path, compress_level=1)
+    print(f"ASCII art saved to {output_path}")
+
+
 def ascii_to_image(
-    ascii_art: List[str], output_path: str, original_width: int, original_height: int
+    ascii_art: Union[List[str], np.ndarray],
+    output_path: str,
+    original_width: int,
+    original_height: int,
 ):
     """
     Render ASCII art to an image and save it.
 
     Args:
-        ascii_art (List[str]): ASCII art as a list of strings.
+        ascii_art (Union[List[str], np.ndarray]): ASCII art as a 2D uint8 array of character codes or a list of strings.
         output_path (str): Path to save the output image.
         original_width (int): Width of the output image.
         original_height (int): Height of the output image.
     """
-    char_width = original_width / len(ascii_art[0])
-    char_height = original_height / len(ascii_art)
+    canvas = render_ascii_art(ascii_art, original_width, original_height)
+    save_rendered_image(canvas, output_path)
 
-    image = Image.new("RGB", (original_width, original_height), "white")
-    draw = ImageDraw.Draw(image)
-
-    font_path = get_default_font()
-    font_size = int(min(char_width, char_height) * 1.5)
-    font = ImageFont.truetype(font_path, font_size)
 
-    for i, line in enumerate(ascii_art):
-        for j, char in enumerate(line):
-            x = int(j * char_width)
-            y = int(i * char_height)
-            draw.text((x, y), char, fill="black", font=font)
+def read_jpeg_shape(image_path: str) -> Optional[Tuple[int, int]]:
+    """
+    Read the dimensions of a JPEG image from its header without decoding pixels.
 
-    image.save(output_path)
-    print(f"ASCII art saved to {output_path}")
+    The EXIF orientation is taken into account, matching what cv2.imread returns.
 
+    Args:
+        image_path (str): Path to the image.
 
-def convert_image_to_ascii_art(image_path: str) -> Tuple[List[str], Tuple[int, int]]:
+    Returns:
+        Optional[Tuple[int, int]]: Image dimensions (height, width), or None if the file is not a JPEG.
     """
-    Convert an image to ASCII art.
+    try:
+        with open(image_path, "rb") as file:
+            if file.read(2) != b"\xff\xd8":  # JPEG start-of-image marker
+                return None
+        # Only the header is read here, so Pillow's decompression bomb guard
+        # (meant for full decodes) must not reject or warn about large images.
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore", Image.DecompressionBombWarning)
+            with Image.open(image_path) as image:
+                # Camera JPEGs carrying extra frames are reported as MPO
+                if image.format not in ("JPEG", "MPO"):
+                    return None
+                width, height = image.size
+                orientation = image.getexif().get(ExifTags.Base.Orientation, 1)
+    except (OSError, UnidentifiedImageError, Image.DecompressionBombError):
+        return None
+    if orientation in (5, 6, 7, 8):  # Rotated by 90 degrees
+        width, height = height, width
+    return height, width
+
+
+def load_image_for_ascii(image_path: str) -> Tuple[cv2.Mat, Tuple[int, int], int]:
+    """
+    Load an image in grayscale at the lowest resolution that ASCII conversion needs.
 
     Args:
         image_path (str): Path to the input image.
 
     Returns:
-        Tuple[List[str], Tuple[int, int]]: ASCII art as a list of strings and original image dimensions.
+        Tuple[cv2.Mat, Tuple[int, int], int]: Decoded image, original image dimensions,
+        and the factor by which the decoded image is smaller than the original.
     """
-    image = cv2.imread(image_path, cv2.IMREAD_GRAYSCALE)
+    # Each ASCII cell averages a whole CHAR_WIDTH x CHAR_HEIGHT block anyway,
+    # so let the JPEG decoder downscale by the largest factor dividing both
+    # sides (skipping most of the IDCT work) and average the smaller blocks.
+    # Other formats gain nothing: OpenCV decodes them fully before reducing.
+    original_shape = read_jpeg_shape(image_path)
+    reduction = max(
+        (
+            factor
+            for factor in REDUCED_GRAYSCALE_FLAGS
+            if CHAR_WIDTH % factor == 0 and CHAR_HEIGHT % factor == 0
+        ),
+        default=1,
+    )
+    if original_shape is None:
+        reduction = 1
+
+    image = cv2.imread(
+        image_path, REDUCED_GRAYSCALE_FLAGS.get(reduction, cv2.IMREAD_GRAYSCALE)
+    )
     if image is None:
         raise FileNotFoundError(f"Image not found at {image_path}")
+    if original_shape is None:
+        original_shape = image.shape
+    return image, original_shape, reduction
+
+
+def downsample_to_ascii(
+    image: cv2.Mat, original_shape: Tuple[int, int], reduction: int
+) -> np.ndarray:
+    """
+    Convert an image returned by load_image_for_ascii to ASCII art.
+
+    Args:
+        image (cv2.Mat): Grayscale image, possibly decoded at reduced resolution.
+        original_shape (Tuple[int, int]): Original image dimensions (height, width).
+        reduction (int): Factor by which the image is smaller than the original.
+
+    Returns:
+        np.ndarray: ASCII art as a 2D uint8 array of character codes.
+    """
+    # Crop so the reduced image yields the same number of cells as the original.
+    original_height, original_width = original_shape
+    block_width = CHAR_WIDTH // reduction
+    block_height = CHAR_HEIGHT // reduction
+    image = image[
+        : (original_height // CHAR_HEIGHT) * block_height,
+        : (original_width // CHAR_WIDTH) * block_width,
+    ]
+
+    downsized_image, ascii_width, ascii_height = resize_image_for_ascii(
+        image, block_width, block_height
+    )
+    return image_to_ascii(downsized_image)
+
+
+def convert_image_to_ascii_art(image_path: str) -> Tuple[np.ndarray, Tuple[int, int]]:
+    """
+    Convert an image to ASCII art.
 
-    downsized_image, ascii_width, ascii_height = resize_image_for_ascii(image)
-    ascii_art = image_to_ascii(downsized_image)
+    Args:
+        image_path (str): Path to the input image.
 
-    return ascii_art, image.shape
+    Returns:
+        Tuple[np.ndarray, Tuple[int, int]]: ASCII art as a 2D uint8 array of character codes and original image dimensions.
+    """
+    image, original_shape, reduction = load_image_for_ascii(image_path)
+    ascii_art = downsample_to_ascii(image, original_shape, reduction)
+
+    return ascii_art, original_shape
 
 
 def save_ascii_art_to_image(
-    ascii_art: List[str], output_path: str, original_shape: Tuple[int, int]
+    ascii_art: Union[List[str], np.ndarray],
+    output_path: str,
+    original_shape: Tuple[int, int],
 ):
     """
     Save ASCII art as an image.
 
     Args:
-        ascii_art (List[str]): ASCII art as a list of strings.
+        ascii_art (Union[List[str], np.ndarray]): ASCII art as a 2D uint8 array of character codes or a list of strings.
         output_path (str): Path to save the output ASCII art image.
         original_shape (Tuple[int, int]): Original image dimensions (height, width).
     """
@@ -133,6 +491,114 @@ def save_ascii_art_to_image(
     ascii_to_image(ascii_art, output_path, original_width, original_height)
 
 
+def _convert_and_save(paths: Tuple[str, str]):
+    """
+    Convert one image to ASCII art and save it; the unit of work for batch mode.
+
+    Args:
+        paths (Tuple[str, str]): Input image path and output image path.
+    """
+    image_path, output_path = paths
+    ascii_art, original_shape = convert_image_to_ascii_art(image_path)
+    save_ascii_art_to_image(ascii_art, output_path, original_shape)
+
+
+def convert_many_images_to_ascii_art(
+    path_pairs: Iterable[Tuple[str, str]], workers: Optional[int] = None
+):
+    """
+    Convert many images to ASCII art images in parallel worker processes.
+
+    Args:
+        path_pairs (Iterable[Tuple[str, str]]): (input image path, output image path) pairs.
+        workers (Optional[int]): Number of worker processes. Defaults to the CPU count.
+    """
+    with multiprocessing.Pool(workers or os.cpu_count()) as pool:
+        for _ in pool.imap_unordered(_convert_and_save, path_pairs):
+            pass
+
+
+# Marks the end of the work items flowing through a pipeline queue
+_PIPELINE_DONE = object()
+
+
+def _run_pipeline_stage(
+    work: Callable[[Any], Any], inbox: queue.Queue, outbox: Optional[queue.Queue]
+):
+    """
+    Apply one pipeline stage to every item from its inbox until the end marker.
+
+    After a failure the stage keeps draining its inbox without doing any work,
+    so upstream stages never block on a full queue; the error is re-raised once
+    the end marker arrives.
+
+    Args:
+        work (Callable[[Any], Any]): Function applied to each item.
+        inbox (queue.Queue): Queue to read items from.
+        outbox (Optional[queue.Queue]): Queue receiving the results, or None for the last stage.
+    """
+    error = None
+    try:
+        while (item := inbox.get()) is not _PIPELINE_DONE:
+            if error is not None:
+                continue
+            try:
+                result = work(item)
+            except Exception as exc:
+                error = exc
+                continue
+            if outbox is not None:
+                outbox.put(result)
+    finally:
+        if outbox is not None:
+            outbox.put(_PIPELINE_DONE)
+    if error is not None:
+        raise error
+
+
+def convert_images_to_ascii_art_pipelined(path_pairs: Iterable[Tuple[str, str]]):
+    """
+    Convert many images to ASCII art images, overlapping disk I/O with CPU work.
+
+    Decoding, ASCII conversion and rendering, and encoding/saving run as three
+    threads connected by small bounded queues, so while one image is rendered
+    the next is being read and the previous one written. OpenCV and Pillow
+    release the GIL in their decoders and encoders.
+
+    Args:
+        path_pairs (Iterable[Tuple[str, str]]): (input image path, output image path) pairs.
+    """
+
+    def load(paths: Tuple[str, str]):
+        image_path, output_path = paths
+        return output_path, load_image_for_ascii(image_path)
+
+    def render(loaded: Tuple[str, Tuple[cv2.Mat, Tuple[int, int], int]]):
+        output_path, (image, original_shape, reduction) = loaded
+        ascii_art = downsample_to_ascii(image, original_shape, reduction)
+        original_height, original_width = original_shape
+        return output_path, render_ascii_art(ascii_art, original_width, original_height)
+
+    def save(rendered: Tuple[str, np.ndarray]):
+        output_path, canvas = rendered
+        save_rendered_image(canvas, output_path)
+
+    pending, loaded, rendered = (queue.Queue(maxsize=2) for _ in range(3))
+    with ThreadPoolExecutor(max_workers=3) as executor:
+        stages = [
+            executor.submit(_run_pipeline_stage, load, pending, loaded),
+            executor.submit(_run_pipeline_stage, render, loaded, rendered),
+            executor.submit(_run_pipeline_stage, save, rendered, None),
+        ]
+        try:
+            for paths in path_pairs:
+                pending.put(paths)
+        finally:
+            pending.put(_PIPELINE_DONE)
+        for stage in stages:
+            stage.result()
+
+
 if __name__ == "__main__":
     parser = argparse.ArgumentParser(
         description="Convert an image to ASCII art and save it as an image."